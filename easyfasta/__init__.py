@@ -1,23 +1,39 @@
 from .easyfata import(
     wrap_sequence,
+    wrap_sequence_to,
     build_index,
+    save_index,
+    load_index,
     get_sequence_index,
+    FastaIndex,
     get_sequence_id,
     fasta_iter,
+    fasta_iter_bytes,
+    fasta_iter_fast,
+    fasta_headers,
     load_fasta,
     complement,
+    complement_array,
     reverse,
     reverse_complement
 )
 
 __all__ = [
     "wrap_sequence",
+    "wrap_sequence_to",
     "build_index",
+    "save_index",
+    "load_index",
     "get_sequence_index",
+    "FastaIndex",
     "get_sequence_id",
     "fasta_iter",
+    "fasta_iter_bytes",
+    "fasta_iter_fast",
+    "fasta_headers",
     "load_fasta",
     "complement",
+    "complement_array",
     "reverse",
     "reverse_complement"
 
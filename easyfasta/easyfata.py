@@ -1,8 +1,33 @@
+import array
+import codecs
+import contextlib
+import functools
+import io
+import itertools
+import mmap
+import os
+import pickle
+import sys
 import typing
 from pathlib import Path
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
 from typing import TextIO, Generator
 
+_BLOCK_SIZE = 1 << 20  # size of the blocks read when scanning a fasta
+# encodings where b">" and b"\n" are the bytes of ">" and "\n" and nothing is prepended to the file,
+# fasta_iter can split the raw bytes of a text file opened with them
+_BYTE_COMPATIBLE_ENCODINGS = {"utf-8", "ascii", "iso8859-1"}
+_INDEX_CHUNK = 64 << 20  # minimum size of the byte range given to each process by build_index
+
+
+def _first_token(p: str|bytes) -> str|bytes:
+    """
+    identifier of an identifier line: its first whitespace separated token (empty if the line is empty).
+    split stops after the first separator, the rest of the line is not tokenized.
+    """
+    tokens = p.split(None, 1)
+    return tokens[0] if tokens else p[:0]
+
 
 def wrap_sequence(sequence: str, chunk_size: int=80) -> str:
     """
@@ -15,27 +40,135 @@ def wrap_sequence(sequence: str, chunk_size: int=80) -> str:
     :return str: 
     
     """
-    new_seq = ""
-    cpt = 0
-    while cpt <= len(sequence):
-        new_seq += sequence[cpt: cpt + chunk_size] + "\n"
-        cpt += chunk_size
-    return new_seq.strip()
+    return "\n".join([sequence[i: i + chunk_size] for i in range(0, len(sequence), chunk_size)])
 
 
-def build_index(fasta_file: str|Path) -> dict[str, int]:
+def wrap_sequence_to(out: TextIO, sequence: str, chunk_size: int=80) -> None:
+    """
+    write sequence to out as lines of chunk_size characters, each line ends with a new line.
+    same lines as wrap_sequence but written as they are produced, the wrapped sequence is never built in memory.
+
+    .. code-block:: python
+
+        with open(out_file, "w") as fo:
+            fo.write(">{}\n".format(sequence_id))
+            wrap_sequence_to(fo, sequence, 80)
+
+    :param TextIO out: an opened file (or any object with a write method)
+    :param str sequence: the string to make multiline
+    :param int chunk_size: the size of the line.
+    """
+    for i in range(0, len(sequence), chunk_size):
+        out.write(sequence[i: i + chunk_size] + "\n")
+
+
+def build_index(fasta_file: str|Path, processes: int|None = 1) -> dict[str, int]:
     """
     build an index from a fasta file, dict sequence identifier -> position
 
+    with processes > 1 the file is split in byte ranges scanned by separate processes, which helps on
+    very large files on fast storage. as with any multiprocessing code, scripts calling it must be
+    protected by ``if __name__ == "__main__":`` on platforms that do not fork.
+
     :param str|Path fasta_file: the fasta file to build index from
+    :param int|None processes: number of processes scanning the file, default 1 (no subprocess). None uses os.cpu_count(), with at most one process per 64 MB of file.
     :return  dict[str, int]: index dictionary  identifier -> position
     """
+    size = os.path.getsize(fasta_file)
+    if processes is None:
+        processes = min(os.cpu_count() or 1, size // _INDEX_CHUNK)
+
+    if processes <= 1:
+        return dict(_index_range(fasta_file, 0, size))
+
+    import concurrent.futures  # only loaded when needed, it pulls logging in at import
+
     index = {}
-    with open(fasta_file) as fi:
-        for p, s, i in fasta_iter(fi, position=True):
-            index[p.split()[0]] = i
+    bounds = [i * size // processes for i in range(processes + 1)]
+    with concurrent.futures.ProcessPoolExecutor(processes) as executor:
+        # ranges come back in file order, a duplicated identifier keeps its last position as in a serial scan
+        for part in executor.map(_index_range, [fasta_file] * processes, bounds[:-1], bounds[1:]):
+            index.update(part)
     return index
 
+
+def _index_range(fasta_file: str|Path, start: int, end: int) -> list[tuple[str, int]]:
+    """
+    (identifier, position) of the identifier lines starting in the byte range [start, end) of fasta_file
+    """
+    with _mmap_file(fasta_file) as mm:
+        return list(_scan_headers(mm, start, end))
+
+
+def save_index(index: dict[str, int], index_file: str|Path) -> None:
+    """
+    save an index made by build_index to a file, reload it with load_index.
+    identifiers are stored as a single newline separated block and positions as a flat array('q'),
+    which is about 3 times faster to write than pickling the dictionary.
+
+    :param dict[str, int] index: index dictionary identifier -> position
+    :param str|Path index_file: the file to write
+    """
+    identifiers = "\n".join(index).encode()
+    positions = array.array("q", index.values())
+    with open(index_file, "wb") as fo:
+        pickle.dump((identifiers, positions), fo, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def load_index(index_file: str|Path) -> dict[str, int]:
+    """
+    load an index saved by save_index. a dictionary pickled directly is also accepted.
+
+    :param str|Path index_file: a file written by save_index
+    :return dict[str, int]: index dictionary identifier -> position
+    """
+    with open(index_file, "rb") as fi:
+        saved = pickle.load(fi)
+    if isinstance(saved, dict):
+        return saved
+    identifiers, positions = saved
+    if not positions:
+        return {}
+    return dict(zip(identifiers.decode().split("\n"), positions))
+
+
+@contextlib.contextmanager
+def _mmap_file(fasta_file: str|Path) -> Generator[mmap.mmap | bytes, None, None]:
+    """
+    read only memory map of a file. an empty file gives b"" as mmap refuses to map it.
+    """
+    with open(fasta_file, "rb") as fi:
+        if os.fstat(fi.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(fi.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def _scan_headers(mm: mmap.mmap | bytes, start: int, end: int) -> Generator[tuple[str, int], None, None]:
+    """
+    yield (identifier, offset) for each identifier line starting in mm[start:end].
+    identifier lines are found with mm.find(b"\\n>"), sequences are never read by python code.
+    """
+    if start == 0 < end and mm[:1] == b">":
+        pos = 0
+    else:
+        pos = mm.find(b"\n>", max(start - 1, 0), end)
+        if pos == -1:
+            return
+        pos += 1
+
+    while True:
+        line_end = mm.find(b"\n", pos)
+        if line_end == -1:
+            line_end = len(mm)
+        yield _first_token(mm[pos + 1: line_end]).decode(), pos
+        pos = mm.find(b"\n>", line_end, end)
+        if pos == -1:
+            return
+        pos += 1
+
+
 def get_sequence_index(fasta_file: str|Path, identifiers:Iterable[str], index_dict:dict[str, int], ignore_unfound: bool = True) -> list[tuple[str, str]]:
     """
     uses index to get sequence from a file faster than just parsing through the file. you need to generate an index first (you can use build_index)
@@ -44,9 +177,9 @@ def get_sequence_index(fasta_file: str|Path, identifiers:Iterable[str], index_di
 
     .. code-block:: python
         index = build_index(fasta_file)
-        # you can save/load the index using pickle 
-        pickle.dump(index, filename)
-        index = pickle.load(filename)
+        # you can save/load the index
+        save_index(index, filename)
+        index = load_index(filename)
         # this can save large amount of time on large file
         sequences = get_sequence_index(fasta_file, identifiers, index)
 
@@ -58,57 +191,289 @@ def get_sequence_index(fasta_file: str|Path, identifiers:Iterable[str], index_di
 
     """
     res = []
-    with open(fasta_file) as open_file:
-
-        for id_ in identifiers:
-
-            offset = index_dict.get(id_)
-            if offset is None and ignore_unfound:
-                continue
-            elif offset is None:
-                print("id: {} is not in index".format(id_))
-                index_dict[id_]  #raise eror
-            open_file.seek(offset, 0)
-
-            open_file.readline()
-            
-            sequence = ""
-            line = open_file.readline().strip()
-
-            while not line.startswith(">") and line:
-                sequence += line.strip()
-                line = open_file.readline()
-            res.append((id_, sequence))
+    wanted = []
+    for id_ in identifiers:
+
+        offset = index_dict.get(id_)
+        if offset is None and ignore_unfound:
+            continue
+        elif offset is None:
+            print("id: {} is not in index".format(id_))
+            index_dict[id_]  #raise eror
+        wanted.append((offset, len(res)))
+        res.append((id_, None))
+
+    # records are read in file order: page faults on the mapping are mostly sequential
+    # and benefit from the kernel readahead
+    with _mmap_file(fasta_file) as mm:
+        last_offset, seq = None, None
+        for offset, i in sorted(wanted):
+            # identifiers requested several times are adjacent once sorted, read only once
+            if offset != last_offset:
+                last_offset, seq = offset, _read_sequence(mm, offset)
+            res[i] = (res[i][0], seq)
     return res
 
 
+def _read_sequence(mm: mmap.mmap | bytes, offset: int) -> str:
+    """
+    read the sequence of the record whose identifier line starts at offset
+
+    :param mmap.mmap mm: a memory mapped fasta file
+    :param int offset: position of the identifier line, as stored by build_index
+    :return str: the sequence
+    """
+    start = mm.find(b"\n", offset)
+    if start == -1:
+        return ""
+    end = mm.find(b"\n>", start)
+    if end == -1:
+        end = len(mm)
+
+    raw = mm[start + 1: end]
+    seq = raw.replace(b"\n", b"")
+    if _needs_strip(seq):
+        seq = _join_lines(raw.split(b"\n"))
+    return seq.decode()
+
+
+class FastaIndex(Mapping):
+    """
+    random access to the sequences of an indexed fasta file, identifier -> sequence.
+    the file stays memory mapped between lookups and recently read sequences are cached,
+    repeated lookups do not reopen or reread the file. use it as a context manager, or call close.
+
+    .. code-block:: python
+
+        with FastaIndex(fasta_file) as fasta:
+            for id_ in identifiers:
+                sequence = fasta[id_]
+
+    :param str|Path fasta_file: a fasta file
+    :param dict[str, int] index_dict: index of the file, built with build_index when not given
+    :param int cache_size: number of most recently read sequences kept in memory, 0 disables the cache
+    """
+
+    def __init__(self, fasta_file: str|Path, index_dict: dict[str, int]|None = None, cache_size: int = 1024):
+        self.index = build_index(fasta_file) if index_dict is None else index_dict
+        self._stack = contextlib.ExitStack()
+        self._mm = self._stack.enter_context(_mmap_file(fasta_file))
+        self._fetch = functools.lru_cache(maxsize=cache_size)(functools.partial(_read_sequence, self._mm))
+
+    def __getitem__(self, id_: str) -> str:
+        return self._fetch(self.index[id_])
+
+    def __contains__(self, id_: object) -> bool:
+        return id_ in self.index
+
+    def __iter__(self) -> typing.Iterator[str]:
+        return iter(self.index)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def close(self) -> None:
+        """release the cached sequences and unmap the file"""
+        self._fetch.cache_clear()
+        self._stack.close()
+
+    def __enter__(self) -> "FastaIndex":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
 def get_sequence_id(fasta_file: str|Path, identifiers: Iterable[str], identifier_only: bool=True) -> list[tuple[str, str]]:
     """
     return sequence in identifiers from the fasta_file. !! will NOT throw a warning/error if a sequence is not found in the fasta!!
 
     :param str|Path  fasta_file: a fasta file
-    :param Iterable identifier: an iterable with id to recover sequence from
+    :param Iterable identifier: an iterable with id to recover sequence from, converted once to a frozenset (unless it already is a set) so each lookup is O(1)
     :param bool identifier_only: fasta are composed of identifier and metadata, by default only use the identifier part of the fasta line set to false to use the full line.
     :return [(str, str)]: [(identifier, sequence)] for each sequences with identifier present in identifier
 
     """
     res = []
+    idset = identifiers if isinstance(identifiers, (set, frozenset)) else frozenset(identifiers)
 
-    with open(fasta_file) as open_file:
-        for p, s in fasta_iter(open_file=open_file):
+    with open(fasta_file, "rb") as open_file:
+        for p, s in fasta_iter_bytes(open_file):
+            p = p.decode()
             if identifier_only:
-                p = p.split()[0]
-            if p in identifiers:
-                res.append((p, s))
+                p = _first_token(p)
+            if p in idset:
+                res.append((p, s.decode()))
     
     return res
 
-# TODO change to fasta iterator
+def _parse_record(record: bytes) -> tuple[bytes, bytes]:
+    """
+    split a raw fasta record (identifier line + sequence lines) into its identifier line and its sequence.
+    a record not starting with '>' (data before the first identifier line) has an empty identifier.
+    """
+    lines = record.split(b"\n")
+    if record[:1] == b">":
+        p = bytes(lines[0][1:].strip())
+        lines = lines[1:]
+    else:
+        p = b""
+    return p, _join_lines(lines)
+
+
+def _join_lines(lines: list[bytes]) -> bytes:
+    """
+    join sequence lines. lines are joined as is in C, they are only stripped one by one
+    when the result contains spaces, tabs or carriage returns.
+    """
+    seq = b"".join(lines)
+    if _needs_strip(seq):
+        seq = b"".join([line.strip() for line in lines])
+    return seq
+
+
+def _needs_strip(seq: bytes) -> bool:
+    """
+    true when joined sequence lines contain spaces, tabs or carriage returns, the lines must then be
+    stripped one by one. shared by every reader so they all return the same sequence.
+    """
+    return b" " in seq or b"\t" in seq or b"\r" in seq
+
+
+def fasta_iter_bytes(open_file: typing.BinaryIO, position: bool=None) -> Generator[tuple[bytes, bytes], None, None] | Generator[tuple[bytes, bytes, int], None, None]:
+    """
+    An Iterator over a fasta file opened in binary mode, identifier line and sequence are returned as bytes.
+
+    The file is read by blocks and records are delimited by searching b"\\n>" in the block,
+    so no python code runs per sequence line. Nothing is decoded: use it when the sequence does
+    not need to be a str (length, hashing, complement and reverse_complement accept bytes).
+
+    .. code-block:: python
+
+        with open(fasta_file, "rb") as fi:
+            for identifier_line, sequence in fasta_iter_bytes(fi):
+                print(identifier_line.decode(), len(sequence))
+
+    :param BinaryIO open_file: a fasta file opened in binary mode
+    :param bool position: if true also return the byte offset of the identifier line, and the signature become Generator((bytes, bytes, int))
+    :return Generator((bytes, bytes)): Iterable(prompt, sequence)
+    """
+    open_file.seek(0)
+    buf = bytearray()
+    offset = 0  # file offset of buf[0]
+    start = 0   # start of the current record in buf
+    search = 0
+    eof = False
+
+    while True:
+        end = buf.find(b"\n>", search)
+        if end == -1:
+            if not eof:
+                block = open_file.read(_BLOCK_SIZE)
+                if block:
+                    # drop the records already yielded, keep the partial one
+                    del buf[:start]
+                    offset += start
+                    search = max(len(buf) - 1, 0)
+                    start = 0
+                    buf += block
+                    continue
+                eof = True
+            if start >= len(buf):
+                return
+            end = len(buf)
+
+        p, seq = _parse_record(buf[start:end])
+        # every identifier line is a record, data before the first one only if it is not blank
+        if seq or buf[start:start + 1] == b">":
+            if not position:
+                yield p, seq
+            else:
+                yield p, seq, offset + start
+        start = search = end + 1
+
+
+def fasta_iter_fast(fasta_file: str|Path, position: bool=None) -> Generator[tuple[bytes, bytes], None, None] | Generator[tuple[bytes, bytes, int], None, None]:
+    """
+    Same records as fasta_iter_bytes, but takes a path and memory maps the file: records are
+    delimited with mmap.find(b"\\n>") and sliced straight out of the page cache, without the read
+    buffer copies. Only for regular files, use fasta_iter_bytes for pipes or compressed streams.
+
+    .. code-block:: python
+
+        for identifier_line, sequence in fasta_iter_fast(fasta_file):
+            print(identifier_line.decode(), len(sequence))
+
+    :param str|Path fasta_file: a fasta file
+    :param bool position: if true also return the byte offset of the identifier line, and the signature become Generator((bytes, bytes, int))
+    :return Generator((bytes, bytes)): Iterable(prompt, sequence)
+    """
+    with _mmap_file(fasta_file) as mm:
+        start = 0
+        size = len(mm)
+        while start < size:
+            end = mm.find(b"\n>", start)
+            if end == -1:
+                end = size
+
+            p, seq = _parse_record(mm[start: end])
+            # every identifier line is a record, data before the first one only if it is not blank
+            if seq or mm[start: start + 1] == b">":
+                if not position:
+                    yield p, seq
+                else:
+                    yield p, seq, start
+            start = end + 1
+
+
+def _fasta_iter_text(open_file: TextIO, position: bool=None) -> Generator[tuple[str, str], None, None] |  Generator[tuple[str, str, int], None, None]:
+    """
+    line by line version of fasta_iter, used for text streams that cannot be scanned as raw bytes (e.g. io.StringIO, utf-16)
+    """
+    last_pos = 0
+    has_record = False
+
+    p, parts = "", []
+    open_file.seek(0)
+    pos = open_file.tell()
+
+    # positions come from tell(), the only offsets seek accepts for every encoding. a text file
+    # cannot tell() while it is iterated, so lines are then read with readline
+    lines = iter(open_file.readline, "") if position else open_file
+    for line in lines:
+
+        if line[:1] == ">":
+
+            if has_record or any(parts):
+                seq = "".join(parts)
+                if not position:
+                    yield p, seq
+                else:
+                    yield p, seq, last_pos
+            has_record = True
+            p, parts = line[1:].strip(), []
+            last_pos = pos
+
+        else:
+            parts.append(line.strip())
+        if position:
+            pos = open_file.tell()
+
+    if has_record or any(parts):
+        seq = "".join(parts)
+        if not position:
+            yield p, seq
+        else:
+            yield p, seq, last_pos
+
+
 def fasta_iter(open_file: TextIO, position: bool=None) -> Generator[tuple[str, str], None, None] |  Generator[tuple[str, str, int], None, None]:
     """
     An Iterator over an opened fasta file.
 
     Note: I developed this while working on extremely large fasta file, which make no sense to load into memory.
+    Files opened in binary mode, or in text mode with utf-8, ascii or latin-1, are read by large blocks and records
+    are split in C, a sequence line never goes through python code. other text streams are read line by line.
 
     .. code-block:: python
 
@@ -120,42 +485,52 @@ def fasta_iter(open_file: TextIO, position: bool=None) -> Generator[tuple[str, s
 
    
     :param TextIO  open_file: an opened fasta file
-    :param bool position: if true return the start of the sequence (including the identifier line) returned by tell. and the signature become Generator((str, str, int)) 
+    :param bool position: if true return the start of the sequence (including the identifier line), it can be passed to open_file.seek. and the signature become Generator((str, str, int)) 
     :return Generator((str, str)): Iterable(prompt, sequence)
     """
-
-    pos = 0
-    last_pos = 0
-    
-    p, seq = "", ""
     open_file.seek(0)
+    if isinstance(open_file.read(0), bytes):
+        binary, encoding = open_file, "utf-8"
+    elif isinstance(open_file, io.TextIOWrapper) and codecs.lookup(open_file.encoding).name in _BYTE_COMPATIBLE_ENCODINGS:
+        # the text layer was reset by seek, read the raw bytes underneath it
+        binary, encoding = open_file.buffer, open_file.encoding
+    else:
+        # other encodings (BOM, utf-16...) and text streams without a binary buffer
+        yield from _fasta_iter_text(open_file, position)
+        return
 
-    line = open_file.readline()
-    while line:
+    for record in fasta_iter_bytes(binary, position):
+        if not position:
+            yield record[0].decode(encoding), record[1].decode(encoding)
+        else:
+            yield record[0].decode(encoding), record[1].decode(encoding), record[2]
 
-        if line.startswith('>'):
 
-            if seq:
+def fasta_headers(open_file: TextIO) -> Generator[str, None, None]:
+    """
+    An Iterator over the identifier lines of an opened fasta file. sequences are skipped without
+    being stored or joined, cheaper than fasta_iter when only identifiers are needed.
 
-                if not position:
-                    yield p, seq
-                else:
-                    yield p, seq, last_pos
-                p, seq = "", ""
-                last_pos = pos
-                pos = open_file.tell()
-                
-            p = line[1:].strip()
+    .. code-block:: python
 
-        else:
-            seq += line.strip()
-            pos = open_file.tell()
-        line = open_file.readline()
+        with open(fasta_file) as fi:
+            n_sequences = sum(1 for _ in fasta_headers(fi))
 
-    if not position:
-        yield p, seq
+    :param TextIO open_file: an opened fasta file
+    :return Generator(str): Iterable(prompt)
+    """
+    open_file.seek(0)
+    lines = iter(open_file)
+    first = next(lines, "")
+    # text or binary is decided from the lines themselves, not from the type of the handle
+    if isinstance(first, str):
+        for line in itertools.chain((first,), lines):
+            if line[:1] == ">":
+                yield line[1:].strip()
     else:
-        yield p, seq, last_pos
+        for line in itertools.chain((first,), lines):
+            if line[:1] == b">":
+                yield line[1:].strip().decode()
 
 
 def load_fasta(fasta) -> dict[str, str]:
@@ -167,9 +542,9 @@ def load_fasta(fasta) -> dict[str, str]:
     
     """
     result = {}
-    with open(fasta) as fi:
-        for p, s in fasta_iter(fi):
-            result[p.split()[0]] = s
+    with open(fasta, "rb") as fi:
+        for p, s in fasta_iter_bytes(fi):
+            result[_first_token(p).decode()] = s.decode()
     return result
 
 """ constant IUPAC complete DNA complement, case insensitive"""
@@ -178,15 +553,77 @@ DNA_COMPLEMENT={"A":"T", "T":"A", "C":"G", "G":"C", "N":"N", "S":"S",\
                 "s":"s", "w":"w", "r": "y", "y": "r", "k": "m", "m": "k", "b":"v", "v":"b", "d":"h", "h":"d",\
                 "a":"t", "t":"a", "c":"g", "g":"c", "n":"n"}
 
-def complement(seq: str) -> str:
+# translation tables built from DNA_COMPLEMENT, str.translate/bytes.translate run in a single C loop
+# one table lookup per base: faster on str/bytes than numpy 2-bit encoding + xor, which needs encode, xor and decode passes
+_COMP_TABLE = str.maketrans(DNA_COMPLEMENT)
+_COMP_TABLE_B = bytes.maketrans("".join(DNA_COMPLEMENT).encode(), "".join(DNA_COMPLEMENT.values()).encode())
+
+
+def _complement_u8(arr, lut, out):
+    """complement loop over a uint8 array, compiled with numba by _complement_array_backend"""
+    for i in range(arr.shape[0]):
+        out[i] = lut[arr[i]]
+
+
+@functools.lru_cache(maxsize=None)
+def _complement_array_backend() -> tuple:
+    """
+    import numpy, and numba when installed, on the first complement of an array so that importing
+    easyfasta never pays for them. return (numpy, 256 entries uint8 lookup table, compiled kernel or None)
     """
-    case insensitive IUPAC complete complement of a DNA sequence
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("complement_array requires numpy") from None
+    lut = np.frombuffer(_COMP_TABLE_B, dtype=np.uint8)
+    try:
+        from numba import njit
+    except ImportError:
+        return np, lut, None
+    return np, lut, njit(cache=True, boundscheck=False)(_complement_u8)
 
-    :param str seq: a DNA sequence
-    :return str: Complement sequence
 
+def _is_ndarray(seq: object) -> bool:
+    """true for a numpy array, without importing numpy: an array can only exist if numpy is already imported"""
+    np = sys.modules.get("numpy")
+    return np is not None and isinstance(seq, np.ndarray)
+
+
+def complement_array(arr: "np.ndarray") -> "np.ndarray":
+    """
+    case insensitive IUPAC complete complement of a DNA sequence stored as a numpy uint8 array of ascii codes.
+    uses a compiled loop when numba is installed, a numpy lookup table otherwise. requires numpy.
+
+    .. code-block:: python
+
+        arr = np.frombuffer(b"ACGT", dtype=np.uint8)
+        complement_array(arr).tobytes()  # b"TGCA"
+
+    :param numpy.ndarray arr: a uint8 array, other shapes and integer types go through the bounds checked numpy lookup (IndexError for values above 255)
+    :return numpy.ndarray: a new uint8 array with the complement sequence
+    """
+    np, lut, kernel = _complement_array_backend()
+    # the compiled loop does not check bounds, only give it what it was written for
+    if kernel is None or not (isinstance(arr, np.ndarray) and arr.dtype == np.uint8 and arr.ndim == 1):
+        return lut[arr]
+    out = np.empty(arr.shape[0], dtype=np.uint8)
+    kernel(arr, lut, out)
+    return out
+
+def complement(seq: str|bytes) -> str|bytes:
     """
-    return "".join([DNA_COMPLEMENT[x] for x in seq ])
+    case insensitive IUPAC complete complement of a DNA sequence.
+    characters that are not IUPAC DNA codes are left unchanged.
+
+    :param str|bytes|numpy.ndarray seq: a DNA sequence, numpy arrays must be of dtype uint8
+    :return str|bytes|numpy.ndarray: Complement sequence, same type as seq
+
+    """
+    if isinstance(seq, str):
+        return seq.translate(_COMP_TABLE)
+    if _is_ndarray(seq):
+        return complement_array(seq)
+    return seq.translate(_COMP_TABLE_B)
 
 def reverse(seq: str) -> str:
     """
@@ -196,14 +633,19 @@ def reverse(seq: str) -> str:
     :return str: reverse sequence
 
     """
-    return "".join([x for x in seq[::-1]])
+    return seq[::-1]
 
-def reverse_complement(seq: str) -> str:
+def reverse_complement(seq: str|bytes) -> str|bytes:
     """
-    case insensitive IUPAC complete reverse complement of a DNA sequence
+    case insensitive IUPAC complete reverse complement of a DNA sequence.
+    characters that are not IUPAC DNA codes are left unchanged.
 
-    :param str seq: a DNA sequence
-    :return str: reverse complemented sequence
+    :param str|bytes|numpy.ndarray seq: a DNA sequence, numpy arrays must be of dtype uint8
+    :return str|bytes|numpy.ndarray: reverse complemented sequence, same type as seq
 
     """
-    return "".join([DNA_COMPLEMENT[x] for x in seq[::-1]])
+    if isinstance(seq, str):
+        return seq[::-1].translate(_COMP_TABLE)
+    if _is_ndarray(seq):
+        return complement_array(seq[::-1])
+    return seq[::-1].translate(_COMP_TABLE_B)